@@ -70,6 +70,9 @@ tar xf widgets-master.tar.bz2 && pushd widgets-master && pip install $PIPARGS .
 # print environment
 pip freeze
 
+# Enable PyOpenGL error checking
+export FSLEYES_GL_DEBUG=1
+
 if [[ "$MACOS_OVERLAY_TEST" == "" ]]; then
 
   # style stage
@@ -207,6 +207,17 @@ import fsl.utils.settings as fslsettings
 import fsleyes_widgets    as fwidgets
 import fsleyes.version    as version
 
+# Under wxPython/Phoenix, the wx.html package
+# must be imported before a wx.App has been
+# created. We import it here, rather than in
+# initialise(), so this is guaranteed even if
+# a wx.App is created before initialise() is
+# called (e.g. when FSLeyes is embedded).
+try:
+    import wx.html  # noqa
+except ImportError:
+    pass
+
 
 # The logger is assigned in
 # the configLogging function
@@ -217,6 +228,22 @@ log = None
 disableLogging = False
 
 
+LOG_VERBOSITY = {
+    1 : [('fsleyes.gl',      logging.WARNING),
+         ('fsleyes.views',   logging.WARNING),
+         ('fsleyes_props',   logging.WARNING),
+         ('fsleyes_widgets', logging.WARNING)],
+    2 : [('fsleyes_props',   logging.WARNING),
+         ('fsleyes_widgets', logging.WARNING)],
+    3 : [('fsleyes_props',   logging.DEBUG),
+         ('fsleyes_widgets', logging.DEBUG)],
+}
+"""Used by :func:`configLogging`. For each verbosity level, contains a list
+of ``(logger, level)`` pairs - these loggers are set to the given level when
+the root logger is set to ``DEBUG``, to keep noisy modules quiet.
+"""
+
+
 __version__ = version.__version__
 """The current *FSLeyes* version (read from the :mod:`fsleyes.version`
 module).
@@ -236,9 +263,14 @@ def canWriteToAssetDir():
     return os.access(assetDir, os.W_OK | os.X_OK)
 
 
-def initialise():
+def initialise(loadFrame=True):
     """Called when `FSLeyes`` is started as a standalone application.  This
     function *must* be called before most other things in *FSLeyes* are used.
+
+    :arg loadFrame: Defaults to ``True``. If ``False``, the
+                    :mod:`fsleyes.frame` module is not imported. This is
+                    useful for off-screen rendering (see :mod:`.render`),
+                    where a :class:`.FSLeyesFrame` is never created.
     """
     import fsleyes.plugins as plugins
 
@@ -252,12 +284,12 @@ def initialise():
     # any plugins saved in the settings dir)
     plugins.initialise()
 
-    # The fsleyes.actions.frameactions module
-    # monkey-patches some things into the
-    # FSLeyesFrame class, so it must be
-    # imported immediately after fsleyes.frame.
-    import fsleyes.frame                 # noqa
-    import fsleyes.actions.frameactions  # noqa
+    # The fsleyes.frame module takes care of
+    # importing fsleyes.actions.frameactions,
+    # which monkey-patches some things into
+    # the FSLeyesFrame class.
+    if loadFrame:
+        import fsleyes.frame  # noqa
 
 
 def _hacksAndWorkarounds():
@@ -265,11 +297,6 @@ def _hacksAndWorkarounds():
     various things.
     """
 
-    # Under wxPython/Phoenix, the
-    # wx.html package must be imported
-    # before a wx.App has been created
-    import wx.html  # noqa
-
     # nibabel rejects NIfTI images where the
     # quaternion vector has a length greater
     # than 1. This is fine, as it is mandated
@@ -315,6 +342,18 @@ def configLogging(verbose=0, noisy=None):
     if noisy is None:
         noisy = []
 
+    log = logging.getLogger()
+
+    # If disableLogging is set (e.g. in frozen
+    # builds), logging calls are usually stripped,
+    # and verbosity-related command line arguments
+    # are not exposed to the user, so there is no
+    # need to set up a formatter/handler. Any
+    # warnings will still be emitted to stderr by
+    # the logging module's last resort handler.
+    if disableLogging:
+        return
+
     # Set up the root logger
     logFormatter = logging.Formatter('%(levelname)8.8s '
                                      '%(filename)20.20s '
@@ -323,37 +362,16 @@ def configLogging(verbose=0, noisy=None):
                                      '%(message)s')
     logHandler  = logging.StreamHandler()
     logHandler.setFormatter(logFormatter)
-
-    log = logging.getLogger()
     log.addHandler(logHandler)
 
-    # Everything below this point sets up verbosity
-    # as requested by the user. But verbosity-related
-    # command line arguments are not exposed to the
-    # user if disableLogging is set.
-    if disableLogging:
-        return
-
     # show dep warnings
     warnings.filterwarnings('default', category=DeprecationWarning)
 
     # Now we can set up logging
-    if verbose == 1:
-        log.setLevel(logging.DEBUG)
-
-        # make some noisy things quiet
-        logging.getLogger('fsleyes.gl')     .setLevel(logging.WARNING)
-        logging.getLogger('fsleyes.views')  .setLevel(logging.WARNING)
-        logging.getLogger('fsleyes_props')  .setLevel(logging.WARNING)
-        logging.getLogger('fsleyes_widgets').setLevel(logging.WARNING)
-    elif verbose == 2:
-        log.setLevel(logging.DEBUG)
-        logging.getLogger('fsleyes_props')  .setLevel(logging.WARNING)
-        logging.getLogger('fsleyes_widgets').setLevel(logging.WARNING)
-    elif verbose == 3:
+    if verbose in LOG_VERBOSITY:
         log.setLevel(logging.DEBUG)
-        logging.getLogger('fsleyes_props')  .setLevel(logging.DEBUG)
-        logging.getLogger('fsleyes_widgets').setLevel(logging.DEBUG)
+        for name, level in LOG_VERBOSITY[verbose]:
+            logging.getLogger(name).setLevel(level)
 
     for mod in noisy:
         logging.getLogger(mod).setLevel(logging.DEBUG)
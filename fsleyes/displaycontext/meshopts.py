@@ -59,6 +59,26 @@ def genMeshColour(overlay):
     return fslcmaps.randomBrightColour()
 
 
+def _mergeChoices(choices, newChoices):
+    """Used by :meth:`MeshOpts.addVertexDataOptions` and
+    :meth:`MeshOpts.addVertexSetOptions`. Appends all items in
+    ``newChoices`` which are not already in ``choices``.
+
+    :returns: A new list containing the merged choices, or ``None`` if
+              ``newChoices`` does not contain anything new.
+    """
+    seen   = set(choices)
+    merged = list(choices)
+
+    for choice in newChoices:
+        if choice not in seen:
+            seen  .add(   choice)
+            merged.append(choice)
+
+    if len(merged) == len(choices): return None
+    else:                           return merged
+
+
 class MeshOpts(cmapopts.ColourMapOpts, fsldisplay.DisplayOpts):
     """The ``MeshOpts`` class defines settings for displaying :class:`.Mesh`
     overlays. See also the :class:`.GiftiOpts` and :class:`.FreesurferOpts`
@@ -439,9 +459,10 @@ class MeshOpts(cmapopts.ColourMapOpts, fsldisplay.DisplayOpts):
 
         vdataProp = self.getProp('vertexData')
         mdataProp = self.getProp('modulateData')
-        newPaths  = paths
-        paths     = vdataProp.getChoices(instance=self)
-        paths     = paths + [p for p in newPaths if p not in paths]
+        paths     = _mergeChoices(vdataProp.getChoices(instance=self), paths)
+
+        if paths is None:
+            return
 
         vdataProp.setChoices(paths, instance=self)
         mdataProp.setChoices(paths, instance=self)
@@ -455,11 +476,10 @@ class MeshOpts(cmapopts.ColourMapOpts, fsldisplay.DisplayOpts):
         """
 
         vsetProp = self.getProp('vertexSet')
-        newPaths = paths
-        paths    = vsetProp.getChoices(instance=self)
-        paths    = paths + [p for p in newPaths if p not in paths]
+        paths    = _mergeChoices(vsetProp.getChoices(instance=self), paths)
 
-        vsetProp.setChoices(paths, instance=self)
+        if paths is not None:
+            vsetProp.setChoices(paths, instance=self)
 
 
     def getConstantColour(self):
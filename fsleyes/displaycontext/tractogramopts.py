@@ -9,6 +9,9 @@ display properties for :class:`.Tractogram` overlays.
 """
 
 
+import                    os
+import concurrent.futures as futures
+
 import numpy   as np
 import nibabel as nib
 
@@ -22,6 +25,76 @@ import fsleyes.displaycontext.colourmapopts as cmapopts
 import fsleyes.displaycontext.vectoropts    as vectoropts
 
 
+RANGE_BLOCK_SIZE = 262144
+"""Size, in bytes, of the blocks that :func:`_nanRange` splits large
+arrays into. This should be small enough for a block to fit in the
+CPU cache.
+"""
+
+
+RANGE_THREAD_SIZE = 67108864
+"""Arrays larger than this size, in bytes, are split up and processed in
+parallel by :func:`_nanRange`.
+"""
+
+
+def _nanRange(data):
+    """Returns the ``(min, max)`` of ``data``, ignoring NaNs.
+
+    Calling ``np.nanmin`` and then ``np.nanmax`` on a large array means
+    that the entire array must be read from main memory twice. Instead,
+    large arrays are processed in successive blocks of
+    :data:`RANGE_BLOCK_SIZE` bytes - the minimum and maximum of each block
+    are calculated together, so that the second reduction reads the block
+    from the cache.
+
+    Arrays larger than :data:`RANGE_THREAD_SIZE` are split into one chunk
+    per CPU, and each chunk is processed in a separate thread (``numpy``
+    releases the GIL while performing the reductions).
+    """
+
+    nelems = max(1, RANGE_BLOCK_SIZE // data.itemsize)
+
+    # fmin/fmax ignore NaNs. Integer data
+    # can't contain NaNs, so we can skip
+    # the NaN-aware reductions for them.
+    if data.dtype.kind in 'fc': minfunc, maxfunc = np.fmin, np.fmax
+    else:                       minfunc, maxfunc = np.minimum, np.maximum
+
+    # Small arrays, or arrays which
+    # can't be flattened without a copy
+    if data.size <= nelems or not data.flags.c_contiguous:
+        return (minfunc.reduce(data, axis=None),
+                maxfunc.reduce(data, axis=None))
+
+    def blockedRange(chunk):
+        lo, hi = None, None
+
+        # Reduce each block, and combine
+        # the result with previous blocks
+        for start in range(0, chunk.size, nelems):
+            block    = chunk[start:start + nelems]
+            blo, bhi = minfunc.reduce(block), maxfunc.reduce(block)
+            if lo is None: lo, hi = blo, bhi
+            else:          lo, hi = minfunc(lo, blo), maxfunc(hi, bhi)
+
+        return lo, hi
+
+    data     = data.reshape(-1)
+    nthreads = min(os.cpu_count() or 1, data.nbytes // RANGE_THREAD_SIZE)
+
+    if nthreads <= 1:
+        return blockedRange(data)
+
+    chunks = np.array_split(data, nthreads)
+    with futures.ThreadPoolExecutor(nthreads) as pool:
+        ranges = list(pool.map(blockedRange, chunks))
+
+    los, his = zip(*ranges)
+
+    return minfunc.reduce(los), maxfunc.reduce(his)
+
+
 class TractogramOpts(fsldisplay.DisplayOpts,
                      cmapopts.ColourMapOpts,
                      vectoropts.VectorOpts):
@@ -83,11 +156,20 @@ class TractogramOpts(fsldisplay.DisplayOpts,
         cmapopts  .ColourMapOpts.__init__(self)
         vectoropts.VectorOpts   .__init__(self)
 
-        olist         = self.overlayList
-        lo, hi        = self.overlay.bounds
-        xlo, ylo, zlo = lo
-        xhi, yhi, zhi = hi
-        self.bounds   = [xlo, xhi, ylo, yhi, zlo, zhi]
+        # Cache of (data, min, max) tuples for
+        # vertex data sets, keyed by data set
+        # name - see __dataRange.
+        self.__dataRanges = {}
+
+        # Most recently calculated effective
+        # colour/clip modes, stored as (mode,
+        # effective mode) tuples, keyed by
+        # property name - see __effectiveMode.
+        self.__effectiveModes = {}
+
+        olist       = self.overlayList
+        lo, hi      = self.overlay.bounds
+        self.bounds = [lo[0], hi[0], lo[1], hi[1], lo[2], hi[2]]
 
         self .addListener('colourMode', self.name, self.__colourModeChanged)
         self .addListener('clipMode',   self.name, self.__clipModeChanged)
@@ -108,11 +190,7 @@ class TractogramOpts(fsldisplay.DisplayOpts,
         """Returns one of ``'orientation'``, ``'vertexData'``, or
         ``'imageData'``, depending on the current :attr:`colourMode`.
         """
-        ovl   = self.overlay
-        cmode = self.colourMode
-        if   isinstance(cmode, fslimage.Image): return 'imageData'
-        elif cmode in ovl.vertexDataSets():     return 'vertexData'
-        else:                                   return 'orientation'
+        return self.__effectiveMode('colourMode', 'orientation')
 
 
     @property
@@ -120,11 +198,7 @@ class TractogramOpts(fsldisplay.DisplayOpts,
         """Returns one of ``'none'``, ``'vertexData'``, or
         ``'imageData'``, depending on the current :attr:`clipMode`.
         """
-        ovl   = self.overlay
-        cmode = self.clipMode
-        if   isinstance(cmode, fslimage.Image): return 'imageData'
-        elif cmode in ovl.vertexDataSets():     return 'vertexData'
-        else:                                   return 'none'
+        return self.__effectiveMode('clipMode', 'none')
 
 
     def getLabels(self):
@@ -150,9 +224,9 @@ class TractogramOpts(fsldisplay.DisplayOpts,
         current :attr:`colourMode`, and selected :attr:`vertexData` or
         :attr:`colourImage`.
         """
-        data = self.__getData(self.colourMode)
-        if data is None: return 0, 1
-        else:            return np.nanmin(data), np.nanmax(data)
+        drange = self.__dataRange(self.colourMode)
+        if drange is None: return 0, 1
+        else:              return drange
 
 
     def getClippingRange(self):
@@ -173,10 +247,7 @@ class TractogramOpts(fsldisplay.DisplayOpts,
         if clipMode in (None, colourMode):
             return None
 
-        data = self.__getData(clipMode)
-
-        if data is None: return None
-        else:            return np.nanmin(data), np.nanmax(data)
+        return self.__dataRange(clipMode)
 
 
     def updateColourClipModes(self, *_):
@@ -194,12 +265,27 @@ class TractogramOpts(fsldisplay.DisplayOpts,
         clipProp   = self.getProp('clipMode')
         clip       = self.clipMode
 
-        vdata     = overlay.vertexDataSets()
-        overlays  = self.displayCtx.getOrderedOverlays()
-        overlays  = [o for o in overlays if isinstance(o, fslimage.Image)]
+        # All images in the overlay list,
+        # followed by all vertex data sets
+        options = [o for o in self.displayCtx.getOrderedOverlays()
+                   if isinstance(o, fslimage.Image)]
+        options.extend(overlay.vertexDataSets())
+
+        colourOptions = ['orientation'] + options
+        clipOptions   = [None]          + options
+
+        # This method is called whenever the overlay
+        # list changes - most of the time this does
+        # not affect the available options, so we
+        # avoid re-setting the choices (and notifying
+        # listeners of the change) if we can.
+        if colourOptions == colourProp.getChoices(instance=self) and \
+           clipOptions   == clipProp  .getChoices(instance=self):
+            return
 
-        colourOptions = ['orientation'] + overlays + vdata
-        clipOptions   = [None]          + overlays + vdata
+        # The effective colour/clip modes may have
+        # changed if vertex data has been loaded.
+        self.__effectiveModes.clear()
 
         colourProp.setChoices(colourOptions, instance=self)
         clipProp  .setChoices(clipOptions,   instance=self)
@@ -262,18 +348,67 @@ class TractogramOpts(fsldisplay.DisplayOpts,
         self.updateDataRange(resetDR=False)
 
 
-    def __getData(self, mode):
-        """Used by :meth:`getDataRange` and :meth:`getClippingRange`. Returns
-        a numpy array containing data to be used for colouring/clipping.
+    def __effectiveMode(self, propName, default):
+        """Used by :meth:`effectiveColourMode` and :meth:`effectiveClipMode`.
+        Returns the effective mode for the current value of the
+        :attr:`colourMode` or :attr:`clipMode` property.
+
+        These methods are called on every draw, so the most recent result
+        for each property is cached, and is re-used as long as the property
+        value has not changed.
+
+        :arg propName: ``'colourMode'`` or ``'clipMode'``
+        :arg default:  Value to return if the property is not set to an
+                       image or a vertex data set.
+        """
+
+        mode   = getattr(self, propName)
+        cached = self.__effectiveModes.get(propName, None)
+
+        if cached is not None and cached[0] is mode:
+            return cached[1]
+
+        if   isinstance(mode, fslimage.Image):      emode = 'imageData'
+        elif mode in self.overlay.vertexDataSets(): emode = 'vertexData'
+        else:                                       emode = default
+
+        self.__effectiveModes[propName] = (mode, emode)
+
+        return emode
+
+
+    def __dataRange(self, mode):
+        """Used by :meth:`getDataRange` and :meth:`getClippingRange`.
+        Returns the ``(min, max)`` range of the data associated with the
+        given ``mode``, or ``None`` if there is no such data.
+
+        The range of :class:`.Image` data is retrieved from the
+        ``Image.dataRange`` property, which is kept up to date by the
+        ``Image`` itself. Data ranges of per-vertex data sets are cached, so
+        that the data does not need to be re-scanned every time the
+        :attr:`colourMode` or :attr:`clipMode` changes.
 
         :arg mode: Current value of :attr:`colourMode` or :attr:`clipMode`.
         """
-        overlay = self.overlay
 
         if isinstance(mode, fslimage.Image):
-            return mode.data
-        elif mode in overlay.vertexDataSets():
-            return overlay.getVertexData(mode)
+            return mode.dataRange
+
         # mode == 'orientation', or an invalid value
-        else:
+        if mode not in self.overlay.vertexDataSets():
             return None
+
+        data   = self.overlay.getVertexData(mode)
+        cached = self.__dataRanges.get(mode, None)
+
+        # A cached range is only valid for
+        # the array it was calculated from -
+        # if new data has been added for a
+        # vertex data set, we recalculate.
+        if cached is not None and cached[0] is data:
+            return cached[1:]
+
+        drange                  = _nanRange(data)
+        self.__dataRanges[mode] = (data,) + drange
+
+        return drange
@@ -844,7 +844,10 @@ def selectByValue(data,
             ranges[ax] = np.arange(lo, hi)
             slices[ax] = slice(    lo, hi)
 
-        xs, ys, zs = np.meshgrid(*ranges, indexing='ij')
+        # Sparse grids are used, as the distance
+        # calculation below broadcasts them out
+        # to the full search space anyway.
+        xs, ys, zs = np.meshgrid(*ranges, indexing='ij', sparse=True)
 
         # Centre those indices and the
         # seed location at (0, 0, 0)
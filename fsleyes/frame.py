@@ -2160,3 +2160,9 @@ class OverlayDropTarget(wx.FileDropTarget):
             return True
         else:
             return False
+
+
+# The frameactions module monkey-patches some
+# things into the FSLeyesFrame class, so must
+# be imported after FSLeyesFrame is defined.
+import fsleyes.actions.frameactions  # noqa
@@ -207,10 +207,20 @@ import OpenGL  # noqa
 OpenGL.ERROR_ON_COPY = True
 
 
-# These flags should be set to True
-# for development, False for production
-OpenGL.ERROR_CHECKING = True
-OpenGL.ERROR_LOGGING  = True
+# When error checking is enabled, PyOpenGL
+# wraps every GL call with an error check,
+# which adds a significant overhead to every
+# draw. These flags are only enabled for
+# development, by setting FSLEYES_GL_DEBUG.
+GL_DEBUG = os.environ.get('FSLEYES_GL_DEBUG', '').lower() \
+    not in ('', '0', 'false', 'no')
+"""Set to ``True`` if the ``FSLEYES_GL_DEBUG`` environment variable is set,
+in which case PyOpenGL error checking and logging are enabled.
+"""
+
+
+OpenGL.ERROR_CHECKING = GL_DEBUG
+OpenGL.ERROR_LOGGING  = GL_DEBUG
 
 
 # If FULL_LOGGING is enabled,
@@ -314,8 +324,22 @@ def hasExtension(ext, glver=None):
         glver = float(GL_COMPATIBILITY)
     if glver >= 3.3:
         return True
-    import OpenGL.extensions as glexts
-    return glexts.hasExtension(ext)
+
+    # The set of available extensions will not
+    # change for the lifetime of the GL context,
+    # so we only query each extension once.
+    available = _extensionCache.get(ext, None)
+    if available is None:
+        import OpenGL.extensions as glexts
+        available            = bool(glexts.hasExtension(ext))
+        _extensionCache[ext] = available
+    return available
+
+
+_extensionCache = {}
+"""Used by :func:`hasExtension` to cache the availability of each OpenGL
+extension that has been queried.
+"""
 
 
 def bootstrap(glVersion=None):
@@ -386,10 +410,8 @@ def bootstrap(glVersion=None):
                     version will be used.
     """
 
+    import importlib
     import OpenGL.GL             as gl
-    import fsleyes.gl.gl14       as gl14
-    import fsleyes.gl.gl21       as gl21
-    import fsleyes.gl.gl33       as gl33
     import fsleyes.gl.extensions as glexts
 
     thismod = sys.modules[__name__]
@@ -407,16 +429,9 @@ def bootstrap(glVersion=None):
     # verstr contains the target compatibility
     # GL version
     glVersion = major + minor / 10.0
-    glpkg     = None
-    if glVersion >= 3.3:
-        verstr = '3.3'
-        glpkg  = gl33
-    elif glVersion >= 2.1:
-        verstr = '2.1'
-        glpkg  = gl21
-    elif glVersion >= 1.4:
-        verstr = '1.4'
-        glpkg  = gl14
+    if   glVersion >= 3.3: verstr = '3.3'
+    elif glVersion >= 2.1: verstr = '2.1'
+    elif glVersion >= 1.4: verstr = '1.4'
     else: raise RuntimeError('OpenGL 1.4 or newer is required '
                              '(detected version: {:0.1f})'.format(glVersion))
 
@@ -436,7 +451,6 @@ def bootstrap(glVersion=None):
                         'to an older OpenGL implementation.'
                         .format(', '.join(exts)))
             verstr = '1.4'
-            glpkg  = gl14
 
     # If using GL14, and the ARB_vertex_program
     # and ARB_fragment_program extensions are
@@ -470,7 +484,11 @@ def bootstrap(glVersion=None):
     log.debug('Using OpenGL {} implementation with renderer {}'.format(
         verstr, renderer))
 
-    # Import GL version-specific sub-modules
+    # Import GL version-specific sub-modules.
+    # Only the package for the chosen version
+    # is imported, e.g. fsleyes.gl.gl21
+    glpkg     = 'fsleyes.gl.gl{}'.format(verstr.replace('.', ''))
+    glpkg     = importlib.import_module(glpkg)
     globjects = ['glvolume', 'glrgbvolume', 'glrgbvector', 'gllinevector',
                  'glmask', 'glmesh', 'gllabel', 'gltensor', 'glsh', 'glmip',
                  'gltractogram']
@@ -978,16 +996,19 @@ class GLContext:
 
         log.debug('Creating gl.OSMesaContext')
 
-        # We have to create a dummy buffer
-        # for the off-screen context.
-        buffer  = glarrays.GLubyteArray.zeros((640, 480, 4))
+        # We have to create a dummy buffer for
+        # the off-screen context. It is never
+        # drawn to - all off-screen rendering
+        # is to a RenderTexture - so it only
+        # needs to be a single pixel.
+        buffer  = glarrays.GLubyteArray.zeros((1, 1, 4))
         context = osmesa.OSMesaCreateContextExt(
             gl.GL_RGBA, 8, 4, 0, None)
         osmesa.OSMesaMakeCurrent(context,
                                  buffer,
                                  gl.GL_UNSIGNED_BYTE,
-                                 640,
-                                 480)
+                                 1,
+                                 1)
 
         self.__buffer  = buffer
         self.__context = context
@@ -1110,8 +1131,16 @@ class OffScreenCanvasTarget:
         """Saves the contents of this canvas as an image, to the specified
         file.
         """
-        import matplotlib.image as mplimg
-        mplimg.imsave(filename, self.getBitmap())
+        import PIL.Image as Image
+
+        bmp = Image.fromarray(self.getBitmap())
+
+        # Formats such as JPEG do
+        # not support transparency
+        try:
+            bmp.save(filename)
+        except OSError:
+            bmp.convert('RGB').save(filename)
 
 
 class WXGLCanvasTarget:
@@ -1213,8 +1242,12 @@ class WXGLCanvasTarget:
         self.__freezeSwapBuffers = False
         self.__context           = context
 
-        self.Bind(wx.EVT_PAINT,            self.__onPaint)
-        self.Bind(wx.EVT_ERASE_BACKGROUND, self.__onEraseBackground)
+        # The whole canvas is repainted on every
+        # draw, so we tell wx not to bother
+        # erasing the background (and to not
+        # generate EVT_ERASE_BACKGROUND events).
+        self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
+        self.Bind(wx.EVT_PAINT, self.__onPaint)
 
 
     def destroy(self):
@@ -1233,11 +1266,6 @@ class WXGLCanvasTarget:
         return self.__context is None
 
 
-    def __onEraseBackground(self, ev):
-        """Called on ``wx.EVT_ERASE_BACKGROUND`` events. Does nothing. """
-        pass
-
-
     def __onPaint(self, ev):
         """Called on ``wx.EVT_PAINT`` events. Schedules :meth:`Refresh`
         to be called on the idle loop.
@@ -1249,9 +1277,13 @@ class WXGLCanvasTarget:
 
         # GL canvases do need to be refreshed
         # on EVT_PAINT events. If they are not,
-        # the canvas will be corrupted.
+        # the canvas will be corrupted. Many
+        # paint events can be generated in quick
+        # succession (e.g. while resizing), but
+        # we only need one refresh to be queued.
         if not self.__freezeDraw:
-            idle.idle(doRefresh)
+            name = '{}_onPaint'.format(id(self))
+            idle.idle(doRefresh, name=name, skipIfQueued=True)
 
 
     def _initGL(self):
@@ -1380,9 +1412,6 @@ class WXGLCanvasTarget:
         if not (fwidgets.isalive(self) and self.IsShownOnScreen()):
             return False
 
-        log.debug('Setting context target to {} ({})'.format(
-            type(self).__name__, id(self)))
-
         return self.__context.setTarget(self)
 
 
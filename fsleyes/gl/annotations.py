@@ -1307,6 +1307,11 @@ class VoxelSelection(AnnotationObject):
         colour              = list(self.colour[:3]) + [self.alpha / 100.0]
         vertices, texCoords = self.vertices2D(zpos, axes)
 
+        # Make sure that any queued
+        # selection changes have
+        # been uploaded to the texture
+        texture.flush()
+
         with texture.bound(gl.GL_TEXTURE0), shader.loaded():
             shader.set(   'tex',      0)
             shader.set(   'MVP',      mvpmat)
@@ -29,6 +29,7 @@ import numpy                   as np
 
 import OpenGL.GL               as gl
 
+import fsl.utils.idle          as idle
 import fsl.transform.affine    as affine
 import fsleyes.gl.gllinevector as gllinevector
 import fsleyes.gl.resources    as glresources
@@ -57,13 +58,20 @@ def init(self):
     updateVertices(   self)
 
     opts = self.opts
+    name = '{}_vertices'.format(self.name)
 
-    def vertexUpdate(*a):
-        updateVertices(self)
-        updateShaderState(self)
-        self.notify()
+    def update():
+        if not self.destroyed:
+            updateVertices(self)
+            updateShaderState(self)
+            self.notify()
 
-    name = '{}_vertices'.format(self.name)
+    # Several of these properties may change
+    # at once, but regenerating the line
+    # vertices is expensive, so we only
+    # queue one update on the idle loop.
+    def vertexUpdate(*a):
+        idle.idle(update, name=name, skipIfQueued=True)
 
     opts.addListener('transform',   name, vertexUpdate, weak=False)
     opts.addListener('directed',    name, vertexUpdate, weak=False)
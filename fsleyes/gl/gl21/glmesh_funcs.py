@@ -44,6 +44,10 @@ def compileShaders(self):
         self.xsectcpShader = shaders.GLSLShader(xsectcpVertSrc, xsectcpFragSrc)
         self.xsectblShader = shaders.GLSLShader(xsectblVertSrc, xsectblFragSrc)
 
+    # New shaders - the mesh geometry
+    # needs to be passed to them
+    self.shaderGeometry = None
+
 
 def updateShaderState(self, **kwargs):
     """Updates the shader program according to the current :class:`.MeshOpts``
@@ -56,6 +60,18 @@ def updateShaderState(self, **kwargs):
     xscpshader = self.xsectcpShader
     xsblshader = self.xsectblShader
 
+    # The vertices, normals and indices are only
+    # re-generated when the mesh geometry changes
+    # (see GLMesh.updateVertices), so we only
+    # copy them to the GPU when they are new.
+    if self.threedee: geometry = [self.vertices, self.normals, self.indices]
+    else:             geometry = [self.vertices, self.indices]
+
+    prev                = self.shaderGeometry
+    newGeometry         = prev is None or \
+                          any(g is not p for g, p in zip(geometry, prev))
+    self.shaderGeometry = geometry
+
     with dshader.loaded():
         dshader.set('cmap',           0)
         dshader.set('negCmap',        1)
@@ -71,9 +87,10 @@ def updateShaderState(self, **kwargs):
         dshader.set('clipHigh',       dopts.clippingRange.xhi)
 
         if self.threedee:
-            dshader.setIndices(self.indices)
-            dshader.setAtt('vertex', self.vertices)
-            dshader.setAtt('normal', self.normals)
+            if newGeometry:
+                dshader.setIndices(self.indices)
+                dshader.setAtt('vertex', self.vertices)
+                dshader.setAtt('normal', self.normals)
 
             vdata = self.getVertexData('vertex')
             mdata = self.getVertexData('modulate')
@@ -88,14 +105,15 @@ def updateShaderState(self, **kwargs):
 
     with fshader.loaded():
         fshader.set('colour', kwargs['flatColour'])
-        if self.threedee:
+        if self.threedee and newGeometry:
             fshader.setAtt('vertex', self.vertices)
             fshader.setAtt('normal', self.normals)
             fshader.setIndices(self.indices)
 
     if not self.threedee:
-        with xscpshader.loaded():
-            xscpshader.setAtt('vertex', self.vertices)
-            xscpshader.setIndices(      self.indices)
+        if newGeometry:
+            with xscpshader.loaded():
+                xscpshader.setAtt('vertex', self.vertices)
+                xscpshader.setIndices(      self.indices)
         with xsblshader.loaded():
             xsblshader.set('colour', kwargs['flatColour'])
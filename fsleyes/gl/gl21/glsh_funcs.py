@@ -37,6 +37,13 @@ import fsleyes.gl.shaders    as shaders
 import fsleyes.gl.extensions as glexts
 
 
+LIGHT_POS  = np.array([-1, -1, 4], dtype=np.float32)
+LIGHT_POS /= np.sqrt(np.sum(LIGHT_POS ** 2))
+"""Light position, in the eye coordinate system, passed to the shader
+program by :func:`updateShaderState`.
+"""
+
+
 def destroy(self):
     """Destroys the shader program """
 
@@ -79,9 +86,6 @@ def updateShaderState(self):
     if shader is None:
         return
 
-    lightPos  = np.array([-1, -1, 4], dtype=np.float32)
-    lightPos /= np.sqrt(np.sum(lightPos ** 2))
-
     shape = image.shape[:3]
     xFlip = opts.orientFlip
 
@@ -103,7 +107,7 @@ def updateShaderState(self):
         changed |= shader.set('xFlip',       xFlip)
         changed |= shader.set('imageShape',  shape)
         changed |= shader.set('lighting',    opts.lighting)
-        changed |= shader.set('lightPos',    lightPos)
+        changed |= shader.set('lightPos',    LIGHT_POS)
         changed |= shader.set('nVertices',   self.vertices.shape[0])
         changed |= shader.set('sizeScaling', opts.size / 100.0)
         changed |= shader.set('radTexture',  4)
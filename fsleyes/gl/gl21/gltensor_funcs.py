@@ -37,6 +37,13 @@ import fsleyes.gl.extensions as glexts
 from . import                   glvector_funcs
 
 
+LIGHT_POS  = np.array([-1, -1, 4], dtype=np.float32)
+LIGHT_POS /= np.sqrt(np.sum(LIGHT_POS ** 2))
+"""Light position, in the eye coordinate system, passed to the shader
+program by :func:`updateShaderState`.
+"""
+
+
 def init(self):
     """Calls :func:`compileShaders` and :func:`updateShaderState`.
     """
@@ -61,6 +68,10 @@ def compileShaders(self):
     """
     self.shader = glvector_funcs.compileShaders(self, 'gltensor')
 
+    # Sphere vertices most recently passed to
+    # the shader - see updateShaderState
+    self.sphereVertices = None
+
 
 def updateShaderState(self):
     """Updates the state of the vertex and fragment shaders. The fragment
@@ -95,11 +106,6 @@ def updateShaderState(self):
     eigValNorm   = 0.5 / max((abs(l1min), abs(l1max)))
     eigValNorm  *= tensorScale / 100.0
 
-    # Define the light position in
-    # the eye coordinate system
-    lightPos  = np.array([-1, -1, 4], dtype=np.float32)
-    lightPos /= np.sqrt(np.sum(lightPos ** 2))
-
     # Vertices of a unit sphere. The vertex
     # shader will transform these vertices
     # into the tensor ellipsoid for each
@@ -132,10 +138,15 @@ def updateShaderState(self):
         changed |= shader.set('imageShape', imageShape)
         changed |= shader.set('eigValNorm', eigValNorm)
         changed |= shader.set('lighting',   opts.lighting)
-        changed |= shader.set('lightPos',   lightPos)
+        changed |= shader.set('lightPos',   LIGHT_POS)
 
-        shader.setAtt('vertex', vertices)
-        shader.setIndices(indices)
+        # unitSphere results are cached, so we only
+        # need to pass the sphere to the shader
+        # when the resolution has changed.
+        if vertices is not self.sphereVertices:
+            shader.setAtt('vertex', vertices)
+            shader.setIndices(indices)
+            self.sphereVertices = vertices
 
     return changed
 
@@ -158,10 +169,36 @@ def draw2D(self, canvas, zpos, axes, xform=None, applyBbox=True):
     final shader state configuration, and draws the tensors.
     """
 
-    opts   = self.opts
-    shader = self.shader
-    mvp    = canvas.mvpMatrix
-    v2dMat = opts.getTransform('voxel', 'display')
+    v2dMat = self.opts.getTransform('voxel', 'display')
+
+    if applyBbox: bbox = canvas.viewport
+    else:         bbox = None
+
+    setNormalMatrix(self, canvas, v2dMat)
+    drawSlice(self, canvas, zpos, axes, xform, bbox, v2dMat)
+
+
+def drawAll(self, canvas, axes, zposes, xforms):
+    """Draws all of the specified slices. The voxel-to-display transform
+    and normal matrix do not depend on the slice, so are only calculated
+    once.
+    """
+
+    v2dMat = self.opts.getTransform('voxel', 'display')
+
+    setNormalMatrix(self, canvas, v2dMat)
+
+    for zpos, xform in zip(zposes, xforms):
+        drawSlice(self, canvas, zpos, axes, xform, None, v2dMat)
+
+
+def setNormalMatrix(self, canvas, v2dMat):
+    """Used by :func:`draw2D` and :func:`drawAll`. Calculates a
+    transformation matrix for normal vectors, and passes it to the shader.
+
+    :arg canvas: The canvas being drawn on
+    :arg v2dMat: The voxel-to-display coordinate system transformation
+    """
 
     # Calculate a transformation matrix for
     # normal vectors - T(I(MV matrix))
@@ -169,8 +206,23 @@ def draw2D(self, canvas, zpos, axes, xform=None, applyBbox=True):
     normalMatrix = affine.concat(mvMat, v2dMat[:3, :3])
     normalMatrix = npla.inv(normalMatrix).T
 
-    if applyBbox: bbox = canvas.viewport
-    else:         bbox = None
+    self.shader.set('normalMatrix', normalMatrix)
+
+
+def drawSlice(self, canvas, zpos, axes, xform, bbox, v2dMat):
+    """Used by :func:`draw2D` and :func:`drawAll`. Draws the tensors for
+    one slice. :func:`setNormalMatrix` must have been called beforehand.
+
+    :arg canvas: The canvas being drawn on
+    :arg zpos:   Position of the slice along the depth axis
+    :arg axes:   Display coordinate system axes
+    :arg xform:  Extra transformation to apply, or ``None``
+    :arg bbox:   Bounding box to restrict the drawn voxels to, or ``None``
+    :arg v2dMat: The voxel-to-display coordinate system transformation
+    """
+
+    shader = self.shader
+    mvp    = canvas.mvpMatrix
 
     if xform is None: xform = affine.concat(mvp, v2dMat)
     else:             xform = affine.concat(mvp, xform, v2dMat)
@@ -182,7 +234,6 @@ def draw2D(self, canvas, zpos, axes, xform=None, applyBbox=True):
     # voxel coordinates for every sphere drawn
     shader.setAtt('voxel',           voxels, divisor=1)
     shader.set(   'voxToDisplayMat', xform)
-    shader.set(   'normalMatrix',    normalMatrix)
 
     with shader.loadedAtts():
         glexts.glDrawElementsInstanced(gl.GL_TRIANGLES,
@@ -192,12 +243,6 @@ def draw2D(self, canvas, zpos, axes, xform=None, applyBbox=True):
                                        nVoxels)
 
 
-def drawAll(self, canvas, axes, zposes, xforms):
-    """Draws all of the specified slices. """
-    for zpos, xform in zip(zposes, xforms):
-        draw2D(self, canvas, zpos, axes, xform, applyBbox=False)
-
-
 def postDraw(self):
     """Unloads the shader program. """
     self.shader.unload()
@@ -40,6 +40,10 @@ def compileShaders(self):
     kwa         = {'resourceName' : f'GLTractogram_{id(self)}',
                    'shared'       : ['vertex']}
 
+    # Circle vertices most recently passed
+    # to each shader program (see draw2D)
+    self.circleVertices = {}
+
     for colourMode, clipMode in it.product(colourModes, clipModes):
 
         fsrc   = colourSources[colourMode]
@@ -65,15 +69,25 @@ def draw2D(self, canvas, mvp):
 
     # each vertex is drawn as a circle,
     # using instanced rendering.
-    vertices         = glroutines.unitCircle(res)
+    vertices         = glroutines.unitCircle(res).copy()
     scales           = self.normalisedLineWidth(canvas, mvp)
     vertices[:, :2] *= scales[:2]
 
     gl.glPolygonMode(gl.GL_FRONT_AND_BACK, gl.GL_FILL)
 
+    # The circle vertices only change when the
+    # resolution, line width, or zoom level
+    # changes, so we avoid re-uploading them
+    # on every draw.
+    prevVertices = self.circleVertices.get(shader, None)
+    newVertices  = prevVertices is None or \
+                   not np.array_equal(prevVertices, vertices)
+
     with shader.loaded(), shader.loadedAtts():
-        shader.set(   'MVP',          mvp)
-        shader.setAtt('circleVertex', vertices)
+        shader.set('MVP', mvp)
+        if newVertices:
+            shader.setAtt('circleVertex', vertices)
+            self.circleVertices[shader] = vertices
         glexts.glDrawArraysInstanced(gl.GL_TRIANGLE_FAN,
                                      0,
                                      len(vertices),
@@ -20,6 +20,7 @@ import OpenGL.GL       as gl
 import numpy           as np
 
 import fsl.transform.affine as affine
+import fsl.utils.memoize    as memoize
 
 
 log = logging.getLogger(__name__)
@@ -1348,6 +1349,7 @@ def planeEquation2(origin, normal):
     return eqn
 
 
+@memoize.memoize
 def unitCircle(res, axes=None):
     """Returns vertices for a 2D circle on a plane defined by ``axes``.
     The circle has origin (0, 0, 0), and radius 1, and can be drawn with
@@ -1355,10 +1357,13 @@ def unitCircle(res, axes=None):
 
     :arg res:  Angular resolutionb Must be at least 3, which will result in
                a triangle. A total of ``res+2`` vertices will be generated.
-    :arg axes: Indices denoting the ``(x, y, z)`` axes. If not provided,
-               set to ``(0, 1, 2)``.
+    :arg axes: Indices denoting the ``(x, y, z)`` axes, as a ``tuple``. If
+               not provided, set to ``(0, 1, 2)``.
     :returns:  A ``numpy.float32`` array containing the vertices of a
                unit circle.
+
+    .. note:: The result is cached, so the returned array is read-only -
+              make a copy of it if you need to modify it.
     """
 
     if res < 3:
@@ -1373,9 +1378,12 @@ def unitCircle(res, axes=None):
     verts[1:, xax] = np.sin(samples)
     verts[1:, yax] = np.cos(samples)
 
+    verts.flags.writeable = False
+
     return verts
 
 
+@memoize.memoize
 def unitSphere(res):
     """Generates a unit sphere, as described in the *Sphere Generation*
     article, on Paul Bourke's excellent website:
@@ -1395,6 +1403,9 @@ def unitSphere(res):
                 defining a vertex ordering that can be used to draw
                 the ellipsoid using the OpenGL ``GL_TRIANGLES`` primitive
                 type.
+
+    .. note:: The result is cached, so the returned arrays are read-only -
+              make a copy of them if you need to modify them.
     """
 
     # All angles to be sampled
@@ -1445,6 +1456,9 @@ def unitSphere(res):
     indices += np.arange(npairs,  dtype=np.uint32).repeat(6)
     indices += np.arange(res - 1, dtype=np.uint32).repeat(6 * (res - 1))
 
+    vertices.flags.writeable = False
+    indices .flags.writeable = False
+
     return vertices, indices
 
 
@@ -36,6 +36,8 @@ shader source code:
 
 import os.path              as op
 
+import fsl.utils.memoize    as memoize
+
 import                         fsleyes
 import fsleyes.gl           as fslgl
 from   .glsl import parse   as glslparse
@@ -103,6 +105,19 @@ def _getShader(prefix, shaderType):
     """Returns the shader source for the given GL type and the given
     shader type (``'vert'``, ``'geom'``, or ``'frag'``).
     """
+    return _loadShader(prefix, shaderType, fslgl.GL_COMPATIBILITY)
+
+
+@memoize.memoize
+def _loadShader(prefix, shaderType, glver):
+    """Used by :func:`_getShader`. Loads and pre-processes the shader
+    source for the given GL type and shader type. The result is cached,
+    so that the source files are only read and pre-processed once for
+    each shader, rather than every time a GL object is created.
+
+    :arg glver: The value of ``fsleyes.gl.GL_COMPATIBILITY`` - only used
+                as a cache key.
+    """
     shaderDir = getShaderDir()
     fname     = _getFileName(prefix, shaderType, shaderDir)
 
@@ -196,10 +196,6 @@ class Filter:
         All other arguments are passed to the :meth:`apply` method.
         """
 
-        with dest.target(0, 1, (0, 0, 0), (1, 1, 1)):
-            if clearDest:
-                gl.glClear(gl.GL_COLOR_BUFFER_BIT |
-                           gl.GL_DEPTH_BUFFER_BIT |
-                           gl.GL_STENCIL_BUFFER_BIT)
+        with dest.target(0, 1, (0, 0, 0), (1, 1, 1), clear=clearDest):
             xform = affine.concat(dest.projectionMatrix, dest.viewMatrix)
             self.apply(source, 0.5, 0, 1, 0, 1, 0, 1, xform)
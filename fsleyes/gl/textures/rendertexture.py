@@ -128,6 +128,21 @@ class RenderTexture(texture2d.Texture2D):
         self.__projectionMatrix = None
         self.__viewMatrix       = None
 
+        # Shader program used for depth-
+        # enabled draws - created on the
+        # first call to draw(useDepth=True)
+        self.__shader           = None
+
+        # Attachment state, set in doRefresh -
+        # see the __attachmentState method
+        self.__attachments      = None
+
+        # Most recent (key, viewport, projmat,
+        # viewmat), used by setRenderViewport
+        # to avoid re-generating a viewport and
+        # matrices which have not changed.
+        self.__viewportCache    = None
+
         # These fields are only set when
         # this RenderTexture is set as a
         # rendering target (e.g. via the
@@ -147,27 +162,19 @@ class RenderTexture(texture2d.Texture2D):
             self.__depthTexture = texture2d.DepthTexture(
                 '{}_depth'.format(self.name))
 
-            # We also need a shader program in
-            # case the creator is intending to
-            # use the depth information in draws.
-            self.__initShader()
-
         log.debug('Created fbo %s [%s]', self.__frameBuffer, rttype)
 
 
     def __initShader(self):
-        """Called by :meth:`__init__` if this ``RenderTexture`` was
-        configured to use a colour and depth texture. Compiles
-        vertex/fragment shader programs which pass the colour and depth
-        values through.
+        """Called by :meth:`draw` the first time that it is called with
+        ``useDepth=True``. Compiles vertex/fragment shader programs which
+        pass the colour and depth values through.
 
         These shaders are used if the :meth:`draw` or
         :meth:`.Texture2D.drawOnBounds` methods are used with the
         ``useDepth=True`` argument.
         """
 
-        self.__shader = None
-
         vertSrc   = shaders.getVertexShader(  'rendertexture')
         fragSrc   = shaders.getFragmentShader('rendertexture')
 
@@ -203,9 +210,13 @@ class RenderTexture(texture2d.Texture2D):
         if self.__depthTexture is not None:
             self.__depthTexture.destroy()
 
+        if self.__shader is not None:
+            self.__shader.destroy()
+
         self.__frameBuffer     = None
         self.__renderBuffer    = None
         self.__depthTexture    = None
+        self.__shader          = None
         self.__oldFrameBuffer  = None
         self.__oldRenderBuffer = None
 
@@ -348,7 +359,10 @@ class RenderTexture(texture2d.Texture2D):
         :func:`.routines.show2D` function.
 
         The existing viewport settings are cached, and can be restored via
-        the :meth:`restoreViewport` method.
+        the :meth:`restoreViewport` method. The :meth:`viewport` bounds, and
+        the projection and view matrices, generated for the most recent
+        axes/bounds are re-used if this method is called again with the same
+        arguments, so they must not be modified in place.
 
         :arg xax: The display coordinate system axis which corresponds to the
                   horizontal screen axis.
@@ -374,14 +388,22 @@ class RenderTexture(texture2d.Texture2D):
 
         self.__oldSize = gl.glGetIntegerv(gl.GL_VIEWPORT)
 
-        width, height  = self.shape
-        projmat, mvmat = glroutines.show2D(xax, yax, lo, hi)
+        width, height = self.shape
+        key           = (xax, yax, tuple(lo), tuple(hi))
+        cache         = self.__viewportCache
+
+        if cache is not None and cache[0] == key:
+            viewport, projmat, mvmat = cache[1:]
+        else:
+            viewport             = tuple(zip(key[2], key[3]))
+            projmat, mvmat       = glroutines.show2D(xax, yax, lo, hi)
+            self.__viewportCache = (key, viewport, projmat, mvmat)
 
         gl.glViewport(0, 0, width, height)
 
         self.__xax              = xax
         self.__yax              = yax
-        self.__viewport         = list(zip(lo, hi))
+        self.__viewport         = viewport
         self.__projectionMatrix = projmat
         self.__viewMatrix       = mvmat
 
@@ -410,20 +432,24 @@ class RenderTexture(texture2d.Texture2D):
 
 
     @contextlib.contextmanager
-    def target(self, *args, **kwargs):
+    def target(self, *args, clear=False, **kwargs):
         """Context manager which binds and unbinds this ``RenderTexture`` as
         the render target, via :meth:`bindAsRenderTarget` and
         :meth:`unbindAsRenderTarget`.
 
-        If any arguments are provided, the viewport is also set and restored
-        via :meth:`setRenderViewport` and :meth:`restoreViewport`.
+        If any other arguments are provided, the viewport is also set and
+        restored via :meth:`setRenderViewport` and :meth:`restoreViewport`.
+
+        :arg clear: Defaults to ``False``. If ``True``, all attachments are
+                    cleared immediately after binding - see
+                    :meth:`bindAsRenderTarget`.
         """
 
         setViewport  = len(args) > 0 or len(kwargs) > 0
         alreadyBound = self.__oldFrameBuffer is not None
 
-        if not alreadyBound:
-            self.bindAsRenderTarget()
+        if not alreadyBound: self.bindAsRenderTarget(clear=clear)
+        elif clear:          self.__clear()
 
         if setViewport:
             self.setRenderViewport(*args, **kwargs)
@@ -436,10 +462,18 @@ class RenderTexture(texture2d.Texture2D):
                 self.unbindAsRenderTarget()
 
 
-    def bindAsRenderTarget(self):
+    def bindAsRenderTarget(self, clear=False):
         """Configures the frame buffer and render buffer of this
         ``RenderTexture`` as the targets for rendering.
 
+        :arg clear: Defaults to ``False``. If ``True``, the colour, depth and
+                    stencil attachments (whichever are configured) are
+                    cleared, using the current clear colour, immediately
+                    after the frame buffer is bound. Tile-based GPUs will
+                    skip restoring the previous frame buffer contents when a
+                    bind is followed directly by a clear, so this should be
+                    used whenever the previous contents are not needed.
+
         The existing farme buffer and render buffer are cached, and can be
         restored via the :meth:`unbindAsRenderTarget` method.
         """
@@ -464,6 +498,19 @@ class RenderTexture(texture2d.Texture2D):
             glexts.glBindRenderbuffer(
                 glexts.GL_RENDERBUFFER, self.__renderBuffer)
 
+        if clear:
+            self.__clear()
+
+
+    def __clear(self):
+        """Used by :meth:`bindAsRenderTarget`. Clears all of the attachments
+        of this ``RenderTexture``.
+        """
+        mask = gl.GL_COLOR_BUFFER_BIT
+        if self.__rttype in ('cd', 'cds'): mask |= gl.GL_DEPTH_BUFFER_BIT
+        if self.__rttype == 'cds':         mask |= gl.GL_STENCIL_BUFFER_BIT
+        gl.glClear(mask)
+
 
     def unbindAsRenderTarget(self):
         """Restores the frame buffer and render buffer which were saved via a
@@ -499,39 +546,56 @@ class RenderTexture(texture2d.Texture2D):
 
         log.debug('Refreshing render texture FBO%s', self.__frameBuffer)
 
-        # Bind the colour buffer
+        old = self.__attachments
+        new = self.__attachmentState()
+
+        # Nothing has changed since the
+        # frame buffer was last configured
+        if new == old:
+            return
+
+        if old is None:
+            old = (None, None, None)
+
+        colour, depth, size = new
+
         with self.target():
-            glexts.glFramebufferTexture2D(
-                glexts.GL_FRAMEBUFFER,
-                glexts.GL_COLOR_ATTACHMENT0,
-                gl   .GL_TEXTURE_2D,
-                self.handle,
-                0)
+
+            # Bind the colour buffer
+            if colour != old[0]:
+                glexts.glFramebufferTexture2D(
+                    glexts.GL_FRAMEBUFFER,
+                    glexts.GL_COLOR_ATTACHMENT0,
+                    gl   .GL_TEXTURE_2D,
+                    colour,
+                    0)
 
             # Combined depth/stencil attachment
             if self.__rttype == 'cds':
 
                 # Configure the render buffer
-                glexts.glRenderbufferStorage(
-                    glexts.GL_RENDERBUFFER,
-                    gl.GL_DEPTH24_STENCIL8,
-                    width,
-                    height)
+                if size != old[2]:
+                    glexts.glRenderbufferStorage(
+                        glexts.GL_RENDERBUFFER,
+                        gl.GL_DEPTH24_STENCIL8,
+                        width,
+                        height)
 
                 # Bind the render buffer
-                glexts.glFramebufferRenderbuffer(
-                    glexts.GL_FRAMEBUFFER,
-                    gl.GL_DEPTH_STENCIL_ATTACHMENT,
-                    glexts.GL_RENDERBUFFER,
-                    self.__renderBuffer)
+                if depth != old[1]:
+                    glexts.glFramebufferRenderbuffer(
+                        glexts.GL_FRAMEBUFFER,
+                        gl.GL_DEPTH_STENCIL_ATTACHMENT,
+                        glexts.GL_RENDERBUFFER,
+                        depth)
 
             # Or a depth texture
-            elif self.__rttype == 'cd':
+            elif self.__rttype == 'cd' and depth != old[1]:
                 glexts.glFramebufferTexture2D(
                     glexts.GL_FRAMEBUFFER,
                     glexts.GL_DEPTH_ATTACHMENT,
                     gl   .GL_TEXTURE_2D,
-                    self.__depthTexture.handle,
+                    depth,
                     0)
 
             # Get the FBO status before unbinding it -
@@ -545,6 +609,25 @@ class RenderTexture(texture2d.Texture2D):
             raise RuntimeError('An error has occurred while configuring '
                                'the frame buffer [{}]'.format(status))
 
+        self.__attachments = new
+
+
+    def __attachmentState(self):
+        """Used by :meth:`doRefresh`. Returns a tuple containing the colour
+        attachment handle, the depth attachment handle (a render buffer or
+        :class:`.DepthTexture` handle), and the texture size. The frame
+        buffer attachments only need to be re-configured when one of these
+        values changes.
+        """
+        rbuf  = self.__renderBuffer
+        dtex  = self.__depthTexture
+        depth = None
+
+        if   rbuf is not None: depth = rbuf
+        elif dtex is not None: depth = dtex.handle
+
+        return (self.handle, depth, tuple(self.shape))
+
 
     def draw(self, vertices, useDepth=False):
         """Overrides :meth:`.Texture2D.draw`. Calls that method, optionally
@@ -570,6 +653,9 @@ class RenderTexture(texture2d.Texture2D):
         if not useDepth:
             texture2d.Texture2D.draw(self, vertices)
         else:
+            if self.__shader is None:
+                self.__initShader()
+
             shader    = self.__shader
             depthTex  = self.__depthTexture
             texCoords = self.generateTextureCoords()
@@ -658,27 +744,23 @@ class GLObjectRenderTexture(RenderTexture):
         log.debug('Data resolution for GLObject %s: %s',
                   type(globj).__name__, resolution)
 
-        width  = resolution[xax]
-        height = resolution[yax]
+        width  = int(resolution[xax])
+        height = int(resolution[yax])
 
         if any((width <= 0, height <= 0)):
             raise ValueError('Invalid GLObject resolution: {}'.format(
                 (width, height)))
 
         # Limit width/height to maxRes, adjusting
-        # them to preserve aspect ratio
+        # them to preserve aspect ratio (rounding
+        # to the nearest integer, but never to 0)
         if width > maxRes or height > maxRes:
-            ratio = min(width, height) / float(max(width, height))
-
             if width > height:
+                height = max(1, (height * maxRes + width // 2) // width)
                 width  = maxRes
-                height = width * ratio
             else:
+                width  = max(1, (width * maxRes + height // 2) // height)
                 height = maxRes
-                width  = height * ratio
-
-            width  = int(round(width))
-            height = int(round(height))
 
         log.debug('Setting %s texture resolution to %sx%s',
                   type(globj).__name__, width, height)
@@ -19,6 +19,7 @@ import numpy     as np
 import OpenGL.GL as gl
 
 import fsl.transform.affine as affine
+import fsl.utils.idle       as idle
 from . import                  texture2d
 from . import                  texture3d
 
@@ -30,6 +31,11 @@ class SelectionTextureBase:
     """Base class shared by the :class:`SelectionTexture2D` and
     :class:`SelectionTexture3D`. Manages updates from the :class:`.Selection`
     object.
+
+    Partial changes to the selection are not uploaded to the texture
+    immediately - the changed regions are queued, and are uploaded in
+    a single patch covering all of them, either on the :mod:`.idle` loop,
+    or when the :meth:`flush` method is called.
     """
 
     def __init__(self, selection):
@@ -37,6 +43,7 @@ class SelectionTextureBase:
         This method must be called *after* :meth:`.Texture.__init__`.
         """
         self.__selection = selection
+        self.__dirty     = []
         selection.register(self.name, self.__selectionChanged)
         self.__selectionChanged(init=True)
 
@@ -54,28 +61,65 @@ class SelectionTextureBase:
         """
         self.__selection.deregister(self.name)
         self.__selection = None
+        self.__dirty     = []
+
+
+    def flush(self):
+        """Uploads all queued selection changes to the texture, as a single
+        patch covering the bounding box of all changed regions. This is
+        called on the :mod:`.idle` loop whenever the selection changes,
+        but may also be called before the texture is drawn, to ensure that
+        it is up to date.
+        """
+
+        dirty = self.__dirty
+
+        if len(dirty) == 0 or self.__selection is None:
+            return
+
+        self.__dirty = []
+        selection    = self.__selection
+        shape        = selection.shape
+        offsets      = np.array([d[0] for d in dirty])
+        ends         = np.array([d[1] for d in dirty])
+        lo           = offsets.min(axis=0)
+        hi           = ends   .max(axis=0)
+        slc          = tuple(slice(a, b) for a, b in zip(lo, hi))
+
+        data   = self.__prepare(selection.getSelection()[slc])
+        offset = affine.transform(lo, self.texCoordXform(shape))
+        self.doPatch(data, offset)
+
+
+    def __prepare(self, data, oldShape=None):
+        """Converts the given selection data into texture data. """
+        # Scale and cast in a single pass,
+        # rather than creating a temporary
+        # and then copying it
+        data = self.shapeData(data, oldShape=oldShape)
+        return np.multiply(data, 255, dtype=np.uint8)
 
 
     def __selectionChanged(self, *a, **kwa):
         """Called when the :attr:`.Selection.selection` changes. Updates
-        the texture data via the :meth:`.Texture.doPatch` method.
+        the texture data via the :meth:`.Texture.set` method, or queues
+        the changed region to be uploaded by the :meth:`flush` method.
         """
 
         init             = kwa.pop('init', False)
         old, new, offset = self.__selection.getLastChange()
         shape            = self.__selection.shape
 
-        def prepare(data, oldShape=None):
-            data = self.shapeData(data, oldShape=oldShape)
-            return (data * 255).astype(np.uint8)
-
         if init or (new is None):
-            data = prepare(self.__selection.getSelection(), shape)
-            self.set(data=data)
+            self.__dirty = []
+            data         = self.__selection.getSelection()
+            self.set(data=self.__prepare(data, shape))
         else:
-            data   = prepare(new)
-            offset = affine.transform(offset, self.texCoordXform(shape))
-            self.doPatch(data, offset)
+            offset = np.asarray(offset)
+            self.__dirty.append((offset, offset + new.shape))
+            idle.idle(self.flush,
+                      name='{}_flush'.format(self.name),
+                      skipIfQueued=True)
 
 
 class SelectionTexture3D(texture3d.Texture3D, SelectionTextureBase):
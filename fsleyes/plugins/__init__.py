@@ -178,13 +178,12 @@ The following functions can be used to access plugins:
 import os.path        as op
 import                   os
 import                   sys
-import                   glob
+import                   shutil
 import                   pkgutil
 import                   logging
 import                   importlib
 import importlib.util as imputil
 import                   collections
-import                   pkg_resources
 
 from typing import List, Dict, Union, Type, Optional
 from types  import ModuleType
@@ -205,6 +204,48 @@ Tool    = Type[actions.Action]
 Plugin  = Union[View, Control, Tool]
 
 
+_pluginCache = {}
+"""Used by :func:`listPlugins` and :func:`_listEntryPoints` to cache the
+installed plugins and their entry points. Cleared by :func:`_clearCache`
+whenever a new distribution is added to the ``pkg_resources`` working set.
+"""
+
+
+_cacheSubscribed = False
+"""Set to ``True`` by :func:`_workingSet` once :func:`_clearCache` has been
+registered as a ``pkg_resources`` working set subscriber.
+"""
+
+
+_builtInsLoaded = False
+"""Set to ``True`` by :func:`_loadBuiltIns` once the built-in plugins have
+been loaded, so that they are not re-loaded on subsequent calls to
+:func:`initialise`.
+"""
+
+
+def _clearCache(dist=None):
+    """Clears the :data:`_pluginCache`. Called whenever a distribution is
+    added to the ``pkg_resources`` working set, including by
+    :func:`_registerEntryPoints`.
+    """
+    _pluginCache.clear()
+
+
+def _workingSet():
+    """Imports ``pkg_resources`` (which is slow to import, so we only import
+    it when it is needed), and returns the global working set. The first
+    time this function is called, :func:`_clearCache` is registered as a
+    working set subscriber.
+    """
+    global _cacheSubscribed
+    import pkg_resources
+    if not _cacheSubscribed:
+        pkg_resources.working_set.subscribe(_clearCache, existing=False)
+        _cacheSubscribed = True
+    return pkg_resources.working_set
+
+
 def class_defines_method(cls, methname):
     """Check to see whether ``methname`` is implemented on ``cls``, and not
     on a base-class.
@@ -219,7 +260,8 @@ def class_defines_method(cls, methname):
 def initialise():
     """Loads all plugins, including built-ins, plugin files in the FSLeyes
     settings directory, and those found on the ``FSLEYES_PLUGIN_PATH``
-    environment variable.
+    environment variable. Entries on ``FSLEYES_PLUGIN_PATH`` may either be
+    directories containing plugin files, or paths to plugin files.
     """
 
     _loadBuiltIns()
@@ -231,8 +273,11 @@ def initialise():
     # plugins on path
     fpp = os.environ.get('FSLEYES_PLUGIN_PATH', None)
     if fpp is not None:
-        for dirname in fpp.split(op.pathsep):
-            pluginFiles.extend(glob.glob(op.join(dirname, '*.py')))
+        for entry in fpp.split(op.pathsep):
+            if entry.endswith('.py') and op.isfile(entry):
+                pluginFiles.append(entry)
+            else:
+                pluginFiles.extend(_listPyFiles(entry))
 
     for fname in pluginFiles:
         try:
@@ -241,6 +286,22 @@ def initialise():
             log.warning('Failed to load plugin file %s: %s', fname, e)
 
 
+def _listPyFiles(dirname : str) -> List[str]:
+    """Used by :func:`initialise`. Returns a list of paths to all ``.py``
+    files in ``dirname`` (equivalent to ``glob(op.join(dirname, '*.py'))``,
+    but using a single ``os.scandir`` call). Returns an empty list if
+    ``dirname`` is not a directory.
+    """
+    if not op.isdir(dirname):
+        return []
+
+    with os.scandir(dirname) as entries:
+        return [e.path for e in entries
+                if e.name.endswith('.py')   and
+                not e.name.startswith('.')  and
+                e.is_file()]
+
+
 def _pluginGroup(cls : Plugin) -> Optional[str]:
     """Returns the type/group of the given plugin, one of ``'views'``,
     ``'controls'``, or ``'tools'``.
@@ -254,9 +315,15 @@ def _pluginGroup(cls : Plugin) -> Optional[str]:
 
 def _loadBuiltIns():
     """Called by :func:`initialise`. Loads all bulit-in plugins, from
-    sub-modules of the ``fsleyes.plugins`` directory.
+    sub-modules of the ``fsleyes.plugins`` directory. Does nothing if the
+    built-in plugins have already been loaded.
     """
 
+    global _builtInsLoaded
+
+    if _builtInsLoaded:
+        return
+
     import fsleyes.plugins.views    as views
     import fsleyes.controls         as controls
     import fsleyes.plugins.controls as pcontrols
@@ -270,30 +337,46 @@ def _loadBuiltIns():
             name = name.split('.')[-1]
             _registerEntryPoints(name, mod, False)
 
+    _builtInsLoaded = True
+
 
 def listPlugins() -> List[str]:
     """Returns a list containing the names of all installed FSLeyes plugins.
     """
-    plugins = []
-    for dist in pkg_resources.working_set:
-        if dist.project_name.startswith('fsleyes-plugin-'):
-            plugins.append(dist.project_name)
-    return list(sorted(plugins))
+    plugins = _pluginCache.get('plugins', None)
+
+    if plugins is None:
+        plugins = []
+        for dist in _workingSet():
+            if dist.project_name.startswith('fsleyes-plugin-'):
+                plugins.append(dist.project_name)
+        plugins = list(sorted(plugins))
+        _pluginCache['plugins'] = plugins
+
+    return list(plugins)
 
 
 def _listEntryPoints(group : str) -> Dict[str, Plugin]:
     """Returns a dictionary containing ``{name : type}`` entry points for the
-    given entry point group.
+    given entry point group. The returned dictionary is cached, and must
+    not be modified.
 
     https://setuptools.readthedocs.io/en/latest/pkg_resources.html#entry-points
     """
-    items = collections.OrderedDict()
-    for plugin in listPlugins():
-        for name, ep in pkg_resources.get_entry_map(plugin, group).items():
-            if name in items:
-                log.debug('Overriding entry point %s [%s] with entry point '
-                          'of the same name from %s', name, group, plugin)
-            items[name] = ep.load()
+    items = _pluginCache.get(group, None)
+
+    if items is None:
+        import pkg_resources
+        items = collections.OrderedDict()
+        for plugin in listPlugins():
+            for name, ep in pkg_resources.get_entry_map(plugin, group).items():
+                if name in items:
+                    log.debug('Overriding entry point %s [%s] with entry '
+                              'point of the same name from %s',
+                              name, group, plugin)
+                items[name] = ep.load()
+        _pluginCache[group] = items
+
     return items
 
 
@@ -301,13 +384,13 @@ def listViews() -> Dict[str, View]:
     """Returns a dictionary of ``{name : ViewPanel}`` mappings containing
     the custom views provided by all installed FSLeyes plugins.
     """
-    views = _listEntryPoints('fsleyes_views')
-    for name, cls in list(views.items()):
+    views = collections.OrderedDict()
+    for name, cls in _listEntryPoints('fsleyes_views').items():
         if not issubclass(cls, viewpanel.ViewPanel):
             log.debug('Ignoring fsleyes_views entry point '
                       '{} - not a ViewPanel'.format(name))
-            views.pop(name)
             continue
+        views[name] = cls
     return views
 
 
@@ -319,15 +402,29 @@ def listControls(viewType : Optional[View] = None) -> Dict[str, Control]:
                    controls which are compatible with this view type are
                    returned (as determined by
                    :meth:`.ControlMixin.supportedViews.`).
+
+    The result for each ``viewType`` is cached in the :data:`_pluginCache`.
     """
-    ctrls = _listEntryPoints('fsleyes_controls')
+    key   = ('fsleyes_controls', viewType)
+    ctrls = _pluginCache.get(key, None)
+
+    if ctrls is not None:
+        return collections.OrderedDict(ctrls)
+
+    ctrls = collections.OrderedDict()
 
-    for name, cls in list(ctrls.items()):
+    for name, cls in _listEntryPoints('fsleyes_controls').items():
         if not issubclass(cls, (ctrlpanel.ControlPanel,
                                 ctrlpanel.ControlToolBar)):
             log.debug('Ignoring fsleyes_controls entry point {} - '
                       'not a ControlPanel/ToolBar'.format(name))
-            ctrls.pop(name)
+            continue
+
+        # No need to check view
+        # support if no view type
+        # has been specified
+        if viewType is None:
+            ctrls[name] = cls
             continue
 
         # views that this control supports - might be None,
@@ -342,14 +439,18 @@ def listControls(viewType : Optional[View] = None) -> Dict[str, Control]:
         if class_defines_method(cls, 'supportSubClasses'):
             subclassok = cls.supportSubClasses()
 
-        if viewType  is not None and \
-           supported is not None:
+        if supported is not None:
             if subclassok:
                 if not issubclass(viewType, tuple(supported)):
-                    ctrls.pop(name)
+                    continue
             elif viewType not in supported:
-                ctrls.pop(name)
-    return ctrls
+                continue
+
+        ctrls[name] = cls
+
+    _pluginCache[key] = ctrls
+
+    return collections.OrderedDict(ctrls)
 
 
 def listTools(viewType : Optional[View] = None) -> Dict[str, Tool]:
@@ -360,26 +461,37 @@ def listTools(viewType : Optional[View] = None) -> Dict[str, Tool]:
                    tools which are compatible with this view type are
                    returned (as determined by
                    :meth:`.Action.supportedViews.`).
+
+    The result for each ``viewType`` is cached in the :data:`_pluginCache`.
     """
-    tools = _listEntryPoints('fsleyes_tools')
-    for name, cls in list(tools.items()):
+    key   = ('fsleyes_tools', viewType)
+    tools = _pluginCache.get(key, None)
+
+    if tools is not None:
+        return collections.OrderedDict(tools)
+
+    tools = collections.OrderedDict()
+
+    for name, cls in _listEntryPoints('fsleyes_tools').items():
 
         if not issubclass(cls, actions.Action):
             log.debug('Ignoring fsleyes_tools entry point '
                       '{} - not an Action'.format(name))
-            tools.pop(name)
             continue
 
-        supported = cls.supportedViews()
-
         if viewType is not None:
             # If a viewType is provided, we don't
             # return view-independent views
+            supported = cls.supportedViews()
             if (supported is None) or \
                (not issubclass(viewType, tuple(supported))):
-                tools.pop(name)
+                continue
 
-    return tools
+        tools[name] = cls
+
+    _pluginCache[key] = tools
+
+    return collections.OrderedDict(tools)
 
 
 def _lookupPlugin(clsname : str, group : str) -> Optional[Plugin]:
@@ -442,23 +554,47 @@ def _findEntryPoints(mod            : ModuleType,
                          :class:`.ViewPanel`, :class:`.ControlPanel`,
                          :class:`.ControlToolBar` and :class:`.Action` base
                          classes are always ignored.
+
+    Classes which have been imported into ``mod`` from another module are
+    ignored - only classes which are defined in ``mod`` (or, if ``mod`` is
+    a package, in one of its sub-modules) are considered.
     """
 
     entryPoints = collections.defaultdict(dict)
+    modname     = mod.__name__
+
+    # All entry points must derive from
+    # one of these types (see _pluginGroup)
+    pluginTypes = (viewpanel.ViewPanel,
+                   ctrlpanel.ControlPanel,
+                   ctrlpanel.ControlToolBar,
+                   actions.Action)
+
+    # Base classes, which are not entry points
+    bases = (viewpanel.ViewPanel,
+             canvaspanel.CanvasPanel,
+             ctrlpanel.ControlPanel,
+             ctrlpanel.ControlToolBar,
+             ctrlpanel.SettingsPanel,
+             actions.Action)
 
     for name in dir(mod):
 
         item = getattr(mod, name)
 
-        if not isinstance(item, type):
+        # Most module attributes are not
+        # classes, or are unrelated classes
+        if not isinstance(item, type) or \
+           not issubclass(item, pluginTypes):
             continue
 
-        bases = [viewpanel.ViewPanel,
-                 canvaspanel.CanvasPanel,
-                 ctrlpanel.ControlPanel,
-                 ctrlpanel.ControlToolBar,
-                 ctrlpanel.SettingsPanel,
-                 actions.Action]
+        # avoid classes which have been imported
+        # into the module from elsewhere - only
+        # classes defined in the module (or, for
+        # packages, in a sub-module) are used
+        itemmod = str(item.__module__)
+        if itemmod != modname and not itemmod.startswith(modname + '.'):
+            continue
 
         # avoid base-classes and built-ins
         if item in bases:
@@ -491,11 +627,17 @@ def _registerEntryPoints(name           : str,
     """Called by :func:`loadPlugin`. Finds and registers all FSLeyes entry
     points defined within the given module.
     """
-    modname  = module.__name__
-    filename = module.__file__
-    distname = 'fsleyes-plugin-{}'.format(name)
-
-    if distname in listPlugins():
+    import pkg_resources
+    workingSet = _workingSet()
+    modname    = module.__name__
+    filename   = module.__file__
+    distname   = 'fsleyes-plugin-{}'.format(name)
+
+    # Look the distribution up directly, rather
+    # than via listPlugins, as each registration
+    # invalidates the listPlugins cache.
+    distkey = pkg_resources.safe_name(distname).lower()
+    if distkey in workingSet.by_key:
         log.debug('Plugin %s is already in environment - skipping', distname)
         return
 
@@ -531,7 +673,8 @@ def _registerEntryPoints(name           : str,
             ep = pkg_resources.EntryPoint.parse(ep, dist=dist)
             entryMap[group][label] = ep
 
-    pkg_resources.working_set.add(dist)
+    # This will trigger a call to _clearCache
+    workingSet.add(dist)
 
 
 def loadPlugin(filename : str):
@@ -556,9 +699,9 @@ def installPlugin(filename : str):
 
     log.debug('Installing plugin %s', filename)
 
-    with open(filename, 'rt')        as inf, \
-         fslsettings.writeFile(dest) as outf:
-        outf.write(inf.read())
+    with open(filename, 'rb')                  as inf, \
+         fslsettings.writeFile(dest, mode='b') as outf:
+        shutil.copyfileobj(inf, outf)
 
     dest = fslsettings.filePath(dest)
 
@@ -81,6 +81,16 @@ class LightBoxViewProfile(profiles.Profile):
 
         self.__canvas = viewPanel.getCanvas()
 
+        # Accumulated mouse wheel scroll/zoom
+        # changes, and the most recent mouse
+        # location, which have not yet been
+        # applied - see _viewModeMouseWheel,
+        # _zoomModeMouseWheel, and
+        # _viewModeLeftMouseDrag.
+        self.__pendingScroll   = 0
+        self.__pendingZoom     = 0
+        self.__pendingLocation = None
+
 
     def getEventTargets(self):
         """Returns the :class:`.LightBoxCanvas` contained in the
@@ -109,12 +119,22 @@ class LightBoxViewProfile(profiles.Profile):
         elif wheel < 0: wheel =  1
         else:           return False
 
-        # See comment in OrthoViewProfile._zoomModeMouseWheel
-        # about timeout
+        # Wheel events are accumulated, and applied
+        # in a single update. If the previous update
+        # has been dropped (see comment in
+        # OrthoViewProfile._zoomModeMouseWheel about
+        # timeout), we start afresh.
+        name = '{}_viewModeMouseWheel'.format(id(self))
+        if not idle.idleLoop.inIdle(name):
+            self.__pendingScroll = 0
+        self.__pendingScroll += wheel
+
         def update():
-            self.viewPanel.scrollpos += wheel
+            scroll               = self.__pendingScroll
+            self.__pendingScroll = 0
+            self.viewPanel.scrollpos += scroll
 
-        idle.idle(update, timeout=0.1)
+        idle.idle(update, name=name, skipIfQueued=True, timeout=0.1)
 
         return True
 
@@ -129,7 +149,22 @@ class LightBoxViewProfile(profiles.Profile):
         if canvasPos is None:
             return False
 
-        self.displayCtx.location.xyz = canvasPos
+        # Mouse events may arrive faster than
+        # the location can be updated and the
+        # canvases redrawn, so we update the
+        # location on the idle loop, using the
+        # most recent mouse position.
+        self.__pendingLocation = canvasPos
+
+        def update():
+            # this profile may have been
+            # destroyed in the meantime
+            if self.displayCtx is not None:
+                self.displayCtx.location.xyz = self.__pendingLocation
+
+        idle.idle(update,
+                  name='{}_viewModeLeftMouseDrag'.format(id(self)),
+                  skipIfQueued=True)
 
         return True
 
@@ -152,11 +187,19 @@ class LightBoxViewProfile(profiles.Profile):
 
         opts = self.viewPanel.sceneOpts
 
-        # see comment in OrthoViewProfile._zoomModeMouseWheel
+        # see comments in _viewModeMouseWheel,
+        # and in OrthoViewProfile._zoomModeMouseWheel
         # about timeout
+        name = '{}_zoomModeMouseWheel'.format(id(self))
+        if not idle.idleLoop.inIdle(name):
+            self.__pendingZoom = 0
+        self.__pendingZoom += wheel
+
         def update():
-            opts.zoom += wheel
+            zoom               = self.__pendingZoom
+            self.__pendingZoom = 0
+            opts.zoom         += zoom
 
-        idle.idle(update, timeout=0.1)
+        idle.idle(update, name=name, skipIfQueued=True, timeout=0.1)
 
         return True
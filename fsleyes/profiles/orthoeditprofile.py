@@ -386,6 +386,11 @@ class OrthoEditProfile(orthoviewprofile.OrthoViewProfile):
         self.__merge3D     = None
         self.__mergeRadius = None
 
+        # The most recent select-by-intensity
+        # drag location, which has not yet been
+        # processed - see _selintModeLeftMouseDrag.
+        self.__pendingSelint = None
+
         # If the view panel performance is not
         # set to maximum, set the initial
         # locationFollowsMouse value to False
@@ -434,10 +439,10 @@ class OrthoEditProfile(orthoviewprofile.OrthoViewProfile):
                          self.__drawModeChanged)
         self.addListener('selectionOverlayColour',
                          self.name,
-                         self.__selectionColoursChanged)
+                         self.__selectionOverlayColourChanged)
         self.addListener('selectionCursorColour',
                          self.name,
-                         self.__selectionColoursChanged)
+                         self.__selectionCursorColourChanged)
         self.addListener('showSelection',
                          self.name,
                          self.__showSelectionChanged)
@@ -469,12 +474,17 @@ class OrthoEditProfile(orthoviewprofile.OrthoViewProfile):
         self.displayCtx .removeListener('selectedOverlay', self.name)
         self.overlayList.removeListener('overlays',        self.name)
 
-        for editor in self.__editors.values():
+        # Clear the editor dictionary before destroying
+        # the editors, in case anything triggered by
+        # their destruction calls back into this profile.
+        editors        = list(self.__editors.values())
+        self.__editors = None
+
+        for editor in editors:
             editor.destroy()
 
         self.__destroyAnnotations()
 
-        self.__editors             = None
         self.__xcanvas             = None
         self.__ycanvas             = None
         self.__zcanvas             = None
@@ -920,18 +930,35 @@ class OrthoEditProfile(orthoviewprofile.OrthoViewProfile):
         self.copyPasteSelection.toggled = pasteSelect
 
 
-    def __selectionColoursChanged(self, *a):
-        """Called when either of the :attr:`selectionOverlayColour` or
-        :attr:`selectionCursorColour` properties change.
-
-        Updates the  :mod:`.annotations` colours accordingly.
+    def __selectionOverlayColourChanged(self, *a):
+        """Called when the :attr:`selectionOverlayColour` property changes.
+        Updates the colour of the :class:`.VoxelSelection` annotations.
         """
         if self.__xselAnnotation is None:
             return
 
-        self.__xselAnnotation.colour = self.selectionOverlayColour
-        self.__yselAnnotation.colour = self.selectionOverlayColour
-        self.__zselAnnotation.colour = self.selectionOverlayColour
+        colour = self.selectionOverlayColour
+        alpha  = colour[3] * 100
+
+        for annot in [self.__xselAnnotation,
+                      self.__yselAnnotation,
+                      self.__zselAnnotation]:
+            annot.colour = colour
+            annot.alpha  = alpha
+
+
+    def __selectionCursorColourChanged(self, *a):
+        """Called when the :attr:`selectionCursorColour` property changes.
+        Updates the colour of the :class:`.Rect` cursor annotations.
+        """
+        if self.__xcurAnnotation is None:
+            return
+
+        colour = self.selectionCursorColour
+
+        self.__xcurAnnotation.colour = colour
+        self.__ycurAnnotation.colour = colour
+        self.__zcurAnnotation.colour = colour
 
 
     def __showSelectionChanged(self, *a):
@@ -986,7 +1013,23 @@ class OrthoEditProfile(orthoviewprofile.OrthoViewProfile):
         srcSel    = srcEditor.getSelection()
         tgtSel    = tgtEditor.getSelection()
 
-        tgtSel.setSelection(srcSel.getSelection(), (0, 0, 0))
+        # Only copy the region which covers the
+        # selected voxels in both the source and
+        # target selections - everything outside
+        # of it is empty in both of them.
+        regions = []
+        for block, offset in [srcSel.getBoundedSelection(),
+                              tgtSel.getBoundedSelection()]:
+            if block.size > 0:
+                offset = np.array(offset)
+                regions.append((offset, offset + block.shape))
+
+        if len(regions) > 0:
+            lo     = [int(v) for v in np.min([r[0] for r in regions], axis=0)]
+            hi     = [int(v) for v in np.max([r[1] for r in regions], axis=0)]
+            slices = tuple(slice(a, b) for a, b in zip(lo, hi))
+            tgtSel.setSelection(srcSel.getSelection()[slices], lo)
+
         srcSel.clearSelection()
 
         return tgtEditor
@@ -1011,6 +1054,25 @@ class OrthoEditProfile(orthoviewprofile.OrthoViewProfile):
             self.__editors[image] = editor
 
 
+    def __pruneEditors(self, keep=None):
+        """Called by :meth:`__selectedOverlayChanged`. Destroys the
+        :class:`.Editor` instances associated with overlays which are no
+        longer in the :class:`.OverlayList`.
+
+        :arg keep: Overlay whose editor should not be destroyed, even if
+                   it has been removed from the overlay list.
+        """
+
+        for ovl in list(self.__editors.keys()):
+            if ovl is keep or ovl in self.overlayList:
+                continue
+
+            log.debug('Destroying Editor for removed overlay {}'.format(
+                ovl.name))
+
+            self.__editors.pop(ovl).destroy()
+
+
     def __setPropertyLimits(self):
         """Called by the :meth:`__selectedOverlayChanged` method.
         """
@@ -1025,9 +1087,10 @@ class OrthoEditProfile(orthoviewprofile.OrthoViewProfile):
         # type, we set limits on the fill/
         # erase values, so the user can't
         # enter an out-of-bounds value.
-        if issubclass(overlay.dtype.type, np.integer):
-            dmin = np.iinfo(overlay.dtype).min
-            dmax = np.iinfo(overlay.dtype).max
+        if overlay.dtype.kind in 'iu':
+            dinfo = np.iinfo(overlay.dtype)
+            dmin  = dinfo.min
+            dmax  = dinfo.max
         else:
             dmin = None
             dmax = None
@@ -1113,6 +1176,7 @@ class OrthoEditProfile(orthoviewprofile.OrthoViewProfile):
         # If the selected overlay hasn't changed,
         # we don't need to do anything
         if overlay == oldOverlay:
+            self.__pruneEditors()
             self.__updateTargetImage()
             return
 
@@ -1130,6 +1194,13 @@ class OrthoEditProfile(orthoviewprofile.OrthoViewProfile):
             self.undo.unbindProps('enabled', editor.undo)
             self.redo.unbindProps('enabled', editor.redo)
 
+        # Destroy the editors for any overlays
+        # which have been removed. The editor
+        # for the old overlay is kept around
+        # (if it has been removed), so that
+        # its selection can be transferred.
+        self.__pruneEditors(keep=oldOverlay)
+
         # Clear 2D selection clipboard
         self.__selectClipboard     = None
         self.__selectClipboardAxis = None
@@ -1216,17 +1287,20 @@ class OrthoEditProfile(orthoviewprofile.OrthoViewProfile):
 
         for c in [self.__xcanvas, self.__ycanvas, self.__zcanvas]:
 
-            sels.append(annotations.VoxelSelection(
-                c.getAnnotations(),
+            annots = c.getAnnotations()
+            sel    = annotations.VoxelSelection(
+                annots,
                 editor.getSelection(),
                 opts,
                 alpha=self.selectionOverlayColour[3] * 100,
-                colour=self.selectionOverlayColour))
+                colour=self.selectionOverlayColour)
+            cur    = annotations.Rect(annots, 0, 0, 0, 0, **cursorKwargs)
+
+            annots.obj(sel, hold=True)
+            annots.obj(cur, hold=True)
 
-            curs.append(annotations.Rect(
-                c.getAnnotations(),
-                0, 0, 0, 0,
-                **cursorKwargs))
+            sels.append(sel)
+            curs.append(cur)
 
         self.__xselAnnotation = sels[0]
         self.__yselAnnotation = sels[1]
@@ -1235,17 +1309,6 @@ class OrthoEditProfile(orthoviewprofile.OrthoViewProfile):
         self.__ycurAnnotation = curs[1]
         self.__zcurAnnotation = curs[2]
 
-        xannot = self.__xcanvas.getAnnotations()
-        yannot = self.__ycanvas.getAnnotations()
-        zannot = self.__zcanvas.getAnnotations()
-
-        xannot.obj(self.__xselAnnotation, hold=True)
-        xannot.obj(self.__xcurAnnotation, hold=True)
-        yannot.obj(self.__yselAnnotation, hold=True)
-        yannot.obj(self.__ycurAnnotation, hold=True)
-        zannot.obj(self.__zselAnnotation, hold=True)
-        zannot.obj(self.__zcurAnnotation, hold=True)
-
         self.__refreshCanvases()
 
 
@@ -1384,10 +1447,26 @@ class OrthoEditProfile(orthoviewprofile.OrthoViewProfile):
 
         .. note:: This is done instead of calling ``OrthoPanel.Refresh``
                   because the latter introduces flickering.
+
+        The refresh is performed on the ``idle`` loop, so that multiple
+        requests made in quick succession (e.g. while the user is holding
+        down the undo shortcut) only result in a single redraw.
         """
-        self.__xcanvas.Refresh()
-        self.__ycanvas.Refresh()
-        self.__zcanvas.Refresh()
+
+        def refresh():
+
+            # The profile may have been
+            # destroyed in the meantime
+            if self.__xcanvas is None:
+                return
+
+            self.__xcanvas.Refresh()
+            self.__ycanvas.Refresh()
+            self.__zcanvas.Refresh()
+
+        idle.idle(refresh,
+                  name='{}_refreshCanvases'.format(self.name),
+                  skipIfQueued=True)
 
 
     def __dynamicRefreshCanvases(self,
@@ -1821,20 +1900,28 @@ class OrthoEditProfile(orthoviewprofile.OrthoViewProfile):
         if mousePos is None or canvas is None:
             return
 
-        voxel = self.__getVoxelLocation(canvasPos)
+        voxel   = self.__getVoxelLocation(canvasPos)
+        overlay = self.__currentOverlay
 
         def update():
+            if self.__currentOverlay is not overlay:
+                return
             self.__selintSelect(voxel, canvas)
             self.__refreshCanvases()
 
         if voxel is not None:
 
             # Asynchronously update the select-by-intensity
-            # selection - we do it async, and with a time out,
+            # selection. Only one update is queued at a time,
             # so we don't queue loads of redundant jobs while
             # the user is e.g. dragging the intensityThres
-            # slider real fast.
-            idle.idle(update, timeout=0.1)
+            # slider, or spinning the mouse wheel in chrad/
+            # chthres mode, real fast. The update reads the
+            # property values when it runs, so it will always
+            # use the most recent values.
+            idle.idle(update,
+                      name='{}_selintUpdate'.format(self.name),
+                      skipIfQueued=True)
 
 
     def __selintThresLimitChanged(self, *a):
@@ -1994,15 +2081,37 @@ class OrthoEditProfile(orthoviewprofile.OrthoViewProfile):
 
         voxel = self.__getVoxelLocation(canvasPos)
 
-        if voxel is not None:
+        if voxel is None:
+            return False
 
-            refreshArgs = (ev, canvas, mousePos, canvasPos)
+        self.__drawCursorAnnotation(canvas, voxel, 1)
+
+        # Select-by-intensity can be expensive, so
+        # we run it on the idle loop. Drag events
+        # which arrive before it has run just
+        # replace the pending location, so only the
+        # most recent location gets selected.
+        overlay              = self.__currentOverlay
+        self.__pendingSelint = (voxel, canvas, ev, mousePos, canvasPos)
+
+        def update():
+
+            pending              = self.__pendingSelint
+            self.__pendingSelint = None
+
+            if pending is None or self.__currentOverlay is not overlay:
+                return
+
+            voxel, canvas, ev, mousePos, canvasPos = pending
 
-            self.__drawCursorAnnotation(canvas, voxel, 1)
             self.__selintSelect(voxel, canvas)
-            self.__dynamicRefreshCanvases(*refreshArgs)
+            self.__dynamicRefreshCanvases(ev, canvas, mousePos, canvasPos)
 
-        return voxel is not None
+        idle.idle(update,
+                  name='{}_selintDrag'.format(self.name),
+                  skipIfQueued=True)
+
+        return True
 
 
     def _selintModeLeftMouseUp(self, ev, canvas, mousePos, canvasPos):
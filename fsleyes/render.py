@@ -55,7 +55,7 @@ def main(args=None, hook=None):
     # Initialise FSLeyes and implement
     # hacks. This must come first as it
     # does a number of important things.
-    fsleyes.initialise()
+    fsleyes.initialise(loadFrame=False)
 
     # Initialise colour maps module
     fslcm.init()
@@ -5,6 +5,7 @@
 # Author: Paul McCarthy <pauldmccarthy@gmail.com>
 #
 
+import functools
 from unittest import mock
 
 import pytest
@@ -48,17 +49,23 @@ dti/dti_FA.nii.gz {{mul('dti/dti_V1.nii.gz', 2.0)}} -ot linevector
 dti/dti_FA.nii.gz {{mul('dti/dti_V1.nii.gz', 2.0)}} -ot linevector -nu
 """
 
-extras = {
-    'roi': roi,
-    'asrgb': asrgb,
-    'mul': mul,
-}
+def extras():
+    # Several commands use the same derived
+    # images, so we only generate each of them
+    # once. The generated files are saved in
+    # the run_cli_tests temporary directory,
+    # so a fresh cache is needed for each call.
+    return {
+        'roi': roi,
+        'asrgb': functools.lru_cache()(asrgb),
+        'mul': functools.lru_cache()(mul),
+    }
 
 
 def test_overlay_linevector():
     run_cli_tests('test_overlay_linevector',
                   cli_tests,
-                  extras=extras)
+                  extras=extras())
 
 
 import fsleyes.gl.textures.data as d
@@ -68,4 +75,4 @@ def test_overlay_linevector_nofloattextures():
                     return_value=(False, None, None)):
         run_cli_tests('test_overlay_linevector_nofloattextures',
                       cli_tests,
-                      extras=extras)
+                      extras=extras())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+#
+# test_lightboxviewprofile.py -
+#
+
+import os.path as op
+
+import numpy as np
+
+from fsl.data.image import Image
+
+from fsleyes.tests import run_with_lightboxpanel, realYield
+
+
+datadir = op.join(op.dirname(__file__), 'testdata')
+
+
+def test_viewModeMouseWheel():
+    run_with_lightboxpanel(_test_viewModeMouseWheel)
+def _test_viewModeMouseWheel(lb, overlayList, displayCtx):
+
+    img = Image(op.join(datadir, '3d'))
+    overlayList.append(img)
+    realYield()
+
+    profile = lb.currentProfile
+    canvas  = lb.getGLCanvases()[0]
+    start   = lb.scrollpos
+
+    profile.mode = 'view'
+
+    # wheel events are accumulated,
+    # and applied on the idle loop
+    profile._viewModeMouseWheel(None, canvas, -1)
+    profile._viewModeMouseWheel(None, canvas, -1)
+    realYield()
+
+    down = lb.scrollpos
+    assert down == min(start + 2, canvas.maxrows)
+
+    profile._viewModeMouseWheel(None, canvas, 1)
+    realYield()
+
+    assert lb.scrollpos == down - 1
+
+
+def test_zoomModeMouseWheel():
+    run_with_lightboxpanel(_test_zoomModeMouseWheel)
+def _test_zoomModeMouseWheel(lb, overlayList, displayCtx):
+
+    img = Image(op.join(datadir, '3d'))
+    overlayList.append(img)
+    realYield()
+
+    profile = lb.currentProfile
+    canvas  = lb.getGLCanvases()[0]
+    opts    = lb.sceneOpts
+    start   = opts.zoom
+
+    profile.mode = 'zoom'
+
+    profile._zoomModeMouseWheel(None, canvas, 1)
+    profile._zoomModeMouseWheel(None, canvas, 1)
+    realYield()
+
+    assert np.isclose(opts.zoom, min(start + 0.1, 1))
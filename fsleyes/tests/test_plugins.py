@@ -32,7 +32,8 @@ plugindirs = [op.abspath(d)                                for d in plugindirs]
 
 def setup_module():
     for d in plugindirs:
-        pkg_resources.working_set.add_entry(d)
+        if d not in pkg_resources.working_set.entries:
+            pkg_resources.working_set.add_entry(d)
     import fsleyes_plugin_example      # noqa
     import fsleyes_plugin_bad_example  # noqa
 
@@ -160,6 +161,27 @@ def test_initialise():
             assert tools['Plugin2Tool']    is p2.Plugin2Tool
 
 
+def test_initialise_pluginFile():
+
+    with tempdir.tempdir(changeto=False) as td:
+        fname = op.join(td, 'plugin3.py')
+        with open(fname, 'wt') as f:
+            f.write(code.format(prefix='Plugin3'))
+
+        with mock.patch.dict('os.environ', {'FSLEYES_PLUGIN_PATH' : fname}):
+
+            plugins.initialise()
+
+            assert 'fsleyes-plugin-plugin3' in plugins.listPlugins()
+
+            p3 = sys.modules['fsleyes_plugin_plugin3']
+
+            assert plugins.listViews()[   'Plugin3View']    is p3.Plugin3View
+            assert plugins.listControls()['Plugin3Control'] is \
+                p3.Plugin3Control
+            assert plugins.listTools()[   'Plugin3Tool']    is p3.Plugin3Tool
+
+
 
 
 def test_runPlugin():
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+#
+# test_tractogramopts.py -
+#
+
+from unittest import mock
+
+import numpy as np
+
+import fsleyes.displaycontext.tractogramopts as tractogramopts
+
+
+def test_nanRange():
+
+    blocksize = 1024
+
+    data = [
+        np.random.random(10),
+        np.random.random(10000).astype(np.float32),
+        np.random.randint(-100, 100, 10000),
+        np.random.random((20, 20, 20)),
+        np.random.random((20, 20, 20))[:, ::2, :],
+    ]
+
+    data[0][5]        = np.nan
+    data[1][::37]     = np.nan
+    data[3][:, 10, 5] = np.nan
+
+    with mock.patch('fsleyes.displaycontext.tractogramopts.'
+                    'RANGE_BLOCK_SIZE', blocksize):
+        for d in data:
+            lo, hi = tractogramopts._nanRange(d)
+            assert lo == np.nanmin(d)
+            assert hi == np.nanmax(d)
+
+        # split across threads
+        with mock.patch('fsleyes.displaycontext.tractogramopts.'
+                        'RANGE_THREAD_SIZE', blocksize * 4):
+            for d in data:
+                lo, hi = tractogramopts._nanRange(d)
+                assert lo == np.nanmin(d)
+                assert hi == np.nanmax(d)